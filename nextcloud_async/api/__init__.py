@@ -18,33 +18,79 @@ from nextcloud_async.exceptions import (
     NextCloudTooManyRequests)
 
 
+STATUS_EXCEPTIONS = {
+    304: NextCloudNotModified,
+    400: NextCloudBadRequest,
+    401: NextCloudUnauthorized,
+    403: NextCloudForbidden,
+    404: NextCloudNotFound,
+    429: NextCloudTooManyRequests,
+}
+
+
 class NextCloudBaseAPI(object):
     """The Base API interface."""
 
     def __init__(
             self,
-            client: httpx.AsyncClient,
-            endpoint: str,
+            client: Optional[httpx.AsyncClient] = None,
+            endpoint: str = '',
             user: str = '',
             password: str = ''):  # noqa: D416
         """Set up the basis for endpoint interaction.
 
         Args
         ----
-            client (httpx.AsyncClient): AsyncClient.  Only httpx supported, but others may
-            work.
-
-            endpoint (str): The nextcloud endpoint URL
+            client (httpx.AsyncClient, optional): AsyncClient.  Only httpx supported, but
+            others may work.  The client is reused for every request, so size its
+            connection pool for the concurrency you need.  A client you pass in stays
+            yours: aclose() and leaving `async with` do not close it, so it may be
+            shared between instances.  Defaults to None, which creates a private
+            client that aclose() does close.  Long-polling calls such as
+            `get_conversation_messages(look_into_future=True)` hold a connection
+            for the whole timeout, e.g.:
+
+                httpx.AsyncClient(
+                    http2=True,  # requires httpx[http2]
+                    limits=httpx.Limits(
+                        max_connections=100,
+                        max_keepalive_connections=20,
+                        keepalive_expiry=30))
+
+            endpoint (str): The nextcloud endpoint URL.  Required.
 
             user (str, optional): User login. Defaults to ''.
 
             password (str, optional): User password. Defaults to ''.
 
+        Raises
+        ------
+            ValueError: No endpoint given
+
         """
+        if not endpoint:
+            raise ValueError('An endpoint URL is required.')
+
         self.user = user
         self.password = password
         self.endpoint = endpoint
-        self.client = client
+        self.client = client if client is not None else httpx.AsyncClient()
+        self.__owns_client = client is None
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if it was created by this instance.
+
+        A client passed to the constructor belongs to the caller and is left
+        open.
+        """
+        if self.__owns_client:
+            await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
 
     async def request(
             self,
@@ -100,18 +146,8 @@ class NextCloudBaseAPI(object):
         except httpx.ReadTimeout:
             raise NextCloudRequestTimeout()
 
-        match response.status_code:
-            case 304:
-                raise NextCloudNotModified()
-            case 400:
-                raise NextCloudBadRequest()
-            case 401:
-                raise NextCloudUnauthorized()
-            case 403:
-                raise NextCloudForbidden()
-            case 404:
-                raise NextCloudNotFound()
-            case 429:
-                raise NextCloudTooManyRequests()
+        exception = STATUS_EXCEPTIONS.get(response.status_code)
+        if exception:
+            raise exception()
 
         return response
@@ -52,7 +52,7 @@ class NextCloudDAVAPI(NextCloudBaseAPI):
                 err = response_data['d:error']
 
                 raise NextCloudException(
-                    f'{err["s:exception"]}: {err["s:message"]}'.replace('\n', ''))
+                    reason=f'{err["s:exception"]}: {err["s:message"]}'.replace('\n', ''))
 
             return response_data['d:multistatus']['d:response']
         else:
@@ -126,7 +126,7 @@ class LoginFlowV2(NextCloudBaseAPI):
 
         if response.status_code == 404:
             raise NextCloudLoginFlowTimeout(
-                'Login flow timed out.  You can try again.')
+                reason='Login flow timed out.  You can try again.')
 
         return response.json()
 
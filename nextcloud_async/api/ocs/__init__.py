@@ -3,12 +3,14 @@
 https://docs.nextcloud.com/server/latest/developer_manual/client_apis/OCS/ocs-api-overview.html
 """
 
-import json
-
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, Sequence
 
 from nextcloud_async.api import NextCloudBaseAPI
 from nextcloud_async.exceptions import NextCloudException
+from nextcloud_async.helpers import json_loads
+
+
+ACTIVITY_PAGING_HEADERS = ('X-Activity-First-Known', 'X-Activity-Last-Given')
 
 
 class NextCloudOCSAPI(NextCloudBaseAPI):
@@ -27,7 +29,7 @@ class NextCloudOCSAPI(NextCloudBaseAPI):
             sub: str = '',
             data: Dict[Any, Any] = {},
             headers: Dict[Any, Any] = {},
-            include_headers: Optional[List] = []) -> Dict:
+            include_headers: Optional[Sequence[str]] = ()) -> Dict:
         """Submit OCS-type query to cloud endpoint.
 
         Args
@@ -43,8 +45,8 @@ class NextCloudOCSAPI(NextCloudBaseAPI):
 
             headers (Dict, optional): Headers for submission. Defaults to {}.
 
-            include_headers (List, optional): Return these headers from response.
-            Defaults to [].
+            include_headers (Sequence, optional): Return these headers from response.
+            Defaults to ().
 
         Raises
         ------
@@ -76,7 +78,7 @@ class NextCloudOCSAPI(NextCloudBaseAPI):
             method, url=url, sub=sub, data=data, headers=headers)
 
         if response.content:
-            response_content = json.loads(response.content.decode('utf-8'))
+            response_content = json_loads(response.content)
             ocs_meta = response_content['ocs']['meta']
             if ocs_meta['status'] != 'ok':
                 raise NextCloudException(
@@ -191,7 +193,7 @@ class NextCloudOCSAPI(NextCloudBaseAPI):
                 'object_id': object_id})
         elif object_id or object_type:
             raise NextCloudException(
-                'filter_object_type and filter_object are both required.')
+                reason='filter_object_type and filter_object are both required.')
 
         data.update({
             'limit': limit,
@@ -202,4 +204,4 @@ class NextCloudOCSAPI(NextCloudBaseAPI):
             method='GET',
             sub=f'/ocs/v2.php/apps/activity/api/v2/activity{filter}',
             data=data,
-            include_headers=['X-Activity-First-Known', 'X-Activity-Last-Given'])
+            include_headers=ACTIVITY_PAGING_HEADERS)
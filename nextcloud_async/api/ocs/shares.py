@@ -7,17 +7,22 @@ Not Implemented:
     Federated share management
 """
 
-import asyncio
+import re
 
 import datetime as dt
 
-from enum import Enum, IntFlag
-from typing import Any, Optional, List
+from enum import IntEnum, IntFlag
+from typing import Optional, List
 
 from nextcloud_async.exceptions import NextCloudException
+from nextcloud_async.helpers import BULK_CONCURRENCY, gather_limited
 
+SHARES_STUB = '/ocs/v2.php/apps/files_sharing/api/v1/shares'
+BOOL_STR = {True: 'true', False: 'false', None: None}
+EXPIRE_DATE_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
 
-class ShareType(Enum):
+
+class ShareType(IntEnum):
     """Share types.
 
     Reference:
@@ -48,6 +53,9 @@ class SharePermission(IntFlag):
     all = 31
 
 
+SHARE_TYPES = frozenset(ShareType)
+
+
 class OCSShareAPI(object):
     """Manage local shares on Nextcloud instances."""
 
@@ -61,7 +69,7 @@ class OCSShareAPI(object):
         """
         return await self.ocs_query(
             method='GET',
-            sub='/ocs/v2.php/apps/files_sharing/api/v1/shares')
+            sub=SHARES_STUB)
 
     async def get_file_shares(
             self,
@@ -86,11 +94,11 @@ class OCSShareAPI(object):
         """
         return await self.ocs_query(
             method='GET',
-            sub='/ocs/v2.php/apps/files_sharing/api/v1/shares',
+            sub=SHARES_STUB,
             data={
                 'path': path,
-                'reshares': str(reshares).lower(),
-                'subfiles': str(subfiles).lower()})
+                'reshares': BOOL_STR[reshares],
+                'subfiles': BOOL_STR[subfiles]})
 
     async def get_share(self, share_id: int):
         """Return information about a known share.
@@ -106,9 +114,33 @@ class OCSShareAPI(object):
         """
         return (await self.ocs_query(
             method='GET',
-            sub=f'/ocs/v2.php/apps/files_sharing/api/v1/shares/{share_id}',
+            sub=f'{SHARES_STUB}/{share_id}',
             data={'share_id': share_id}))[0]
 
+    async def get_shares(
+            self,
+            share_ids: List[int],
+            concurrency: int = BULK_CONCURRENCY) -> List:
+        """Return information about several known shares.
+
+        Args
+        ----
+            share_ids (list): Share IDs
+
+            concurrency (int, optional): Maximum simultaneous requests. Defaults to
+            BULK_CONCURRENCY.
+
+        Returns
+        -------
+            list: Share descriptions, in the order of `share_ids`.  A share that
+            cannot be fetched has its exception returned in its place.
+
+        """
+        return await gather_limited(
+            concurrency,
+            *(self.get_share(share_id) for share_id in share_ids),
+            return_exceptions=True)
+
     async def create_share(
             self,
             path: str,
@@ -143,7 +175,8 @@ class OCSShareAPI(object):
 
         Raises
         ------
-            NextCloudException: Invalid expiration date or date in the past.
+            NextCloudException: Invalid share type or permissions, invalid expiration
+            date or date in the past.
 
         Returns
         -------
@@ -153,27 +186,39 @@ class OCSShareAPI(object):
 
         # Checks the expire_date argument exists before evaluation, otherwise continues.
         if expire_date:
+            match = EXPIRE_DATE_RE.fullmatch(expire_date)
+            if match is None:
+                raise NextCloudException(reason='Invalid date.  Should be YYYY-MM-DD')
             try:
-                expire_dt = dt.datetime.strptime(expire_date, r'%Y-%m-%d')
+                expire_dt = dt.date(*map(int, match.groups()))
             except ValueError:
-                raise NextCloudException('Invalid date.  Should be YYYY-MM-DD')
+                raise NextCloudException(reason='Invalid date.  Should be YYYY-MM-DD')
             else:
-                now = dt.datetime.now()
-                if expire_dt < now:
-                    raise NextCloudException('Invalid date.  Should be in the future.')
+                if expire_dt <= dt.date.today():
+                    raise NextCloudException(reason='Invalid date.  Should be in the future.')
+
+        if share_type not in SHARE_TYPES:
+            raise NextCloudException(reason=f'Invalid share type: {share_type}')
+
+        if int(permissions) & ~SharePermission.all.value:
+            raise NextCloudException(reason=f'Invalid share permissions: {permissions}')
+
+        data = {
+            'path': path,
+            'shareType': int(share_type),
+            'permissions': int(permissions),
+            'publicUpload': BOOL_STR[allow_public_upload]}
+        optional = (
+            ('shareWith', share_with),
+            ('password', password),
+            ('expireDate', expire_date),
+            ('note', note))
+        data.update((key, value) for key, value in optional if value is not None)
 
         return await self.ocs_query(
             method='POST',
-            sub='/ocs/v2.php/apps/files_sharing/api/v1/shares',
-            data={
-                'path': path,
-                'shareType': share_type.value,
-                'shareWith': share_with,
-                'permissions': permissions.value,
-                'publicUpload': str(allow_public_upload).lower(),
-                'password': password,
-                'expireDate': expire_date,
-                'note': note})
+            sub=SHARES_STUB,
+            data=data)
 
     async def delete_share(self, share_id: int):
         """Delete an existing share.
@@ -189,7 +234,7 @@ class OCSShareAPI(object):
         """
         return await self.ocs_query(
             method='DELETE',
-            sub=f'/ocs/v2.php/apps/files_sharing/api/v1/shares/{share_id}',
+            sub=f'{SHARES_STUB}/{share_id}',
             data={'share_id': share_id}
         )
 
@@ -203,10 +248,7 @@ class OCSShareAPI(object):
             note: Optional[str] = None) -> List:
         """Update properties of an existing share.
 
-        This function makes asynchronous calls to the __update_share function
-        since the underlying API can only accept one modification per query.
-        We launch one asynchronous request per given parameter and return a
-        list containing the results of all queries.
+        All given properties are sent to the server in a single request.
 
         Args
         ----
@@ -225,30 +267,30 @@ class OCSShareAPI(object):
 
             note (str): Note for this share.  Defaults to None.
 
+            Only arguments that are not None are sent, so an empty string may be
+            used to clear `password` or `note`.
+
         Returns
         -------
-            List: responses from update queries
+            List: The updated share description, or an empty list if nothing was
+            given to update.
 
         """
-        reqs = []
-        attrs = [
-            ('permissions', permissions),
+        attrs = (
+            ('permissions', None if permissions is None else int(permissions)),
             ('password', password),
-            ('publicUpload', str(allow_public_upload).lower()),
+            ('publicUpload', BOOL_STR[allow_public_upload]),
             ('expireDate', expire_date),
-            ('note', note)]
+            ('note', note))
+        data = {key: value for key, value in attrs if value is not None}
 
-        for a in attrs:
-            if a[1]:
-                reqs.append(self.__update_share(share_id, *a))
+        if not data:
+            return []
 
-        return await asyncio.gather(*reqs)
-
-    async def __update_share(self, share_id, key: str, value: Any):
-        return await self.ocs_query(
+        return [await self.ocs_query(
             method='PUT',
-            sub=f'/ocs/v2.php/apps/files_sharing/api/v1/shares/{share_id}',
-            data={key: value})
+            sub=f'{SHARES_STUB}/{share_id}',
+            data=data)]
 
     async def search_sharees(
             self,
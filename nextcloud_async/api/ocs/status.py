@@ -3,12 +3,18 @@
 https://docs.nextcloud.com/server/latest/developer_manual/client_apis/OCS/ocs-status-api.html
 """
 
-import datetime as dt
+import copy
+import time
 
 from enum import Enum, auto
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 from nextcloud_async.exceptions import NextCloudException
+from nextcloud_async.helpers import BULK_CONCURRENCY, TTLCache, gather_limited, single_flight
+
+USER_STATUS_STUB = '/ocs/v2.php/apps/user_status/api/v1'
+PREDEFINED_STATUSES_CACHE_TTL = 60
+USER_STATUSES_CACHE_TTL = 2
 
 
 class StatusType(Enum):
@@ -24,6 +30,18 @@ class StatusType(Enum):
 class OCSStatusAPI(object):
     """Manage a user's status on Nextcloud instances."""
 
+    __predefined_statuses_cache = None
+    __user_statuses_cache = None
+    __inflight_user_statuses = None
+    __user_statuses_generation = 0
+
+    def __invalidate_user_statuses(self):
+        self.__user_statuses_generation += 1
+        if self.__user_statuses_cache is not None:
+            self.__user_statuses_cache.clear()
+        if self.__inflight_user_statuses is not None:
+            self.__inflight_user_statuses.pop(self.user, None)
+
     async def get_status(self):
         """Get current status.
 
@@ -34,7 +52,7 @@ class OCSStatusAPI(object):
         """
         return await self.ocs_query(
             method='GET',
-            sub=r'/ocs/v2.php/apps/user_status/api/v1/user_status')
+            sub=f'{USER_STATUS_STUB}/user_status')
 
     async def set_status(self, status_type: StatusType):
         """Set user status.
@@ -48,10 +66,12 @@ class OCSStatusAPI(object):
             dict: New status description.
 
         """
-        return await self.ocs_query(
+        response = await self.ocs_query(
             method='PUT',
-            sub=r'/ocs/v2.php/apps/user_status/api/v1/user_status/status',
+            sub=f'{USER_STATUS_STUB}/user_status/status',
             data={'statusType': status_type.name})
+        self.__invalidate_user_statuses()
+        return response
 
     def __validate_future_timestamp(self, ts: Union[float, int]) -> None:
         """Verify the given unix timestamp is valid and in the future.
@@ -65,26 +85,35 @@ class OCSStatusAPI(object):
             NextCloudException: Invalid timestamp or timestamp in the past
 
         """
-        try:
-            clear_dt = dt.datetime.fromtimestamp(ts)
-        except (TypeError, ValueError):
-            raise NextCloudException('Invalid `clear_at`.  Should be unix timestamp.')
+        if not isinstance(ts, (int, float)) or ts != ts:
+            raise NextCloudException(reason='Invalid `clear_at`.  Should be unix timestamp.')
 
-        now = dt.datetime.now()
-        if clear_dt <= now:
-            raise NextCloudException('Invalid `clear_at`.  Should be in the future.')
+        if ts <= time.time():
+            raise NextCloudException(reason='Invalid `clear_at`.  Should be in the future.')
 
     async def get_predefined_statuses(self):
         """Get list of predefined statuses.
 
+        Predefined statuses ship with the server, so results are cached for
+        PREDEFINED_STATUSES_CACHE_TTL seconds.  Each call returns its own copy.
+
         Returns
         -------
             list: Predefined statuses
 
         """
-        return await self.ocs_query(
-            method='GET',
-            sub=r'/ocs/v2.php/apps/user_status/api/v1/predefined_statuses')
+        if self.__predefined_statuses_cache is None:
+            self.__predefined_statuses_cache = TTLCache(
+                ttl=PREDEFINED_STATUSES_CACHE_TTL, maxsize=1)
+
+        statuses = self.__predefined_statuses_cache.get(None)
+        if statuses is None:
+            statuses = await self.ocs_query(
+                method='GET',
+                sub=f'{USER_STATUS_STUB}/predefined_statuses')
+            self.__predefined_statuses_cache.set(None, statuses)
+
+        return copy.deepcopy(statuses)
 
     async def choose_predefined_status(
             self,
@@ -108,10 +137,12 @@ class OCSStatusAPI(object):
         if clear_at:
             self.__validate_future_timestamp(clear_at)
             data.update({'clearAt': clear_at})
-        return await self.ocs_query(
+        response = await self.ocs_query(
             method='PUT',
-            sub=r'/ocs/v2.php/apps/user_status/api/v1/user_status/message/predefined',
+            sub=f'{USER_STATUS_STUB}/user_status/message/predefined',
             data=data)
+        self.__invalidate_user_statuses()
+        return response
 
     async def set_status_message(
             self,
@@ -140,10 +171,12 @@ class OCSStatusAPI(object):
         if clear_at:
             self.__validate_future_timestamp(clear_at)
             data.update({'clearAt': clear_at})
-        return await self.ocs_query(
+        response = await self.ocs_query(
             method='PUT',
-            sub=r'/ocs/v2.php/apps/user_status/api/v1/user_status/message/custom',
+            sub=f'{USER_STATUS_STUB}/user_status/message/custom',
             data=data)
+        self.__invalidate_user_statuses()
+        return response
 
     async def clear_status_message(self):
         """Clear status message.
@@ -153,9 +186,11 @@ class OCSStatusAPI(object):
             Empty 200 Response
 
         """
-        return await self.ocs_query(
+        response = await self.ocs_query(
             method='DELETE',
-            sub=r'/ocs/v2.php/apps/user_status/api/v1/user_status/message')
+            sub=f'{USER_STATUS_STUB}/user_status/message')
+        self.__invalidate_user_statuses()
+        return response
 
     async def get_all_user_statuses(
             self,
@@ -163,6 +198,11 @@ class OCSStatusAPI(object):
             offset: Optional[int] = 0):
         """Get all user statuses.
 
+        Results are cached for USER_STATUSES_CACHE_TTL seconds per page, and
+        dropped whenever this client changes its own status; a page fetched
+        while such a change was made is not cached.  Each call returns its
+        own copy.
+
         Args
         ----
             limit (int, optional): Results per page. Defaults to 100.
@@ -174,14 +214,29 @@ class OCSStatusAPI(object):
             list: User statuses
 
         """
-        return await self.ocs_query(
-            method='GET',
-            sub=r'/ocs/v2.php/apps/user_status/api/v1/statuses',
-            data={'limit': limit, 'offset': offset})
+        if self.__user_statuses_cache is None:
+            self.__user_statuses_cache = TTLCache(ttl=USER_STATUSES_CACHE_TTL)
+
+        key = (limit, offset)
+        statuses = self.__user_statuses_cache.get(key)
+        if statuses is None:
+            generation = self.__user_statuses_generation
+            statuses = await self.ocs_query(
+                method='GET',
+                sub=f'{USER_STATUS_STUB}/statuses',
+                data={'limit': limit, 'offset': offset})
+            # Don't cache a listing fetched across one of our own status changes.
+            if generation == self.__user_statuses_generation:
+                self.__user_statuses_cache.set(key, statuses)
+
+        return copy.deepcopy(statuses)
 
     async def get_user_status(self, user: str):
         """Get the status for a specific user.
 
+        Concurrent requests for the same user share a single HTTP request.
+        Each caller receives its own copy of the result.
+
         Args
         ----
             user (str): User ID
@@ -191,6 +246,37 @@ class OCSStatusAPI(object):
             dict: User status description
 
         """
-        return await self.ocs_query(
-            method='GET',
-            sub=f'/ocs/v2.php/apps/user_status/api/v1/statuses/{user}')
+        if self.__inflight_user_statuses is None:
+            self.__inflight_user_statuses = {}
+
+        status = await single_flight(
+            self.__inflight_user_statuses,
+            user,
+            lambda: self.ocs_query(
+                method='GET',
+                sub=f'{USER_STATUS_STUB}/statuses/{user}'))
+        return copy.deepcopy(status)
+
+    async def get_user_statuses(
+            self,
+            users: List[str],
+            concurrency: int = BULK_CONCURRENCY) -> List:
+        """Get the statuses for several users.
+
+        Args
+        ----
+            users (list): User IDs
+
+            concurrency (int, optional): Maximum simultaneous requests. Defaults to
+            BULK_CONCURRENCY.
+
+        Returns
+        -------
+            list: User status descriptions, in the order of `users`.  A status that
+            cannot be fetched has its exception returned in its place.
+
+        """
+        return await gather_limited(
+            concurrency,
+            *(self.get_user_status(user) for user in users),
+            return_exceptions=True)
@@ -1,8 +1,19 @@
 """Talk API interface."""
 
-import json
+import asyncio
+import copy
 
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, List, Dict, Optional
+
+from nextcloud_async.api.ocs.shares import SHARES_STUB
+from nextcloud_async.exceptions import NextCloudNotModified
+from nextcloud_async.helpers import (
+    BULK_CONCURRENCY,
+    TTLCache,
+    gather_limited,
+    json_dumps,
+    single_flight)
 
 from .constants import (
     Permissions,
@@ -10,10 +21,32 @@ from .constants import (
     NotificationLevel,
     ListableScope)
 from .rich_objects import NextCloudTalkRichObject
-from .exceptions import NextCloudTalkNotCapable
+from .exceptions import NextCloudTalkBadRequest, NextCloudTalkNotCapable
 
 
 TALK_CAPS = 'capabilities.spreed.features'
+CONVERSATION_STUB = '/ocs/v2.php/apps/spreed/api/v4'
+CHAT_STUB = '/ocs/v2.php/apps/spreed/api/v1'
+
+# Resolve enum names to wire values once, instead of going through the
+# Enum metaclass on every request.
+CONVERSATION_TYPES = {t.name: t.value for t in ConversationType}
+NOTIFICATION_LEVELS = {n.name: n.value for n in NotificationLevel}
+LISTABLE_SCOPES = {s.name: s.value for s in ListableScope}
+
+# Response headers returned alongside chat data.
+LAST_COMMON_READ_HEADERS = ('X-Chat-Last-Common-Read',)
+CHAT_PAGING_HEADERS = ('X-Chat-Last-Given', 'X-Chat-Last-Common-Read')
+
+# Mention autocomplete fires on every keystroke; serve repeats from memory.
+AUTOCOMPLETE_CACHE_TTL = 10
+AUTOCOMPLETE_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=None)
+def _talk_metadata(message_type: str) -> str:
+    """Return the JSON-encoded talkMetaData for a file share message type."""
+    return json_dumps({'messageType': message_type})
 
 
 class NextCloudTalkAPI(object):
@@ -21,17 +54,63 @@ class NextCloudTalkAPI(object):
 
     conv_stub = None
     chat_sub = None
+    __suggestion_cache = None
+    __pending_read_markers = None
+    __talk_features = None
+    __inflight_stubs = None
+    __inflight_conversations = None
+
+    # Seconds to wait for further mark-as-read calls on the same conversation
+    # before sending a single read marker for the newest message.  The default
+    # only merges calls issued together, e.g. from one asyncio.gather().
+    read_marker_delay = 0
 
     async def __get_stubs(self):
-        if 'conversation-v4' in await self.get_capabilities(TALK_CAPS):
-            self.conv_stub = '/ocs/v2.php/apps/spreed/api/v4'
+        features = frozenset(await self.get_capabilities(TALK_CAPS))
+
+        if 'conversation-v4' in features:
+            self.conv_stub = CONVERSATION_STUB
         else:
-            raise NextCloudTalkNotCapable('Unable to determine active Conversation endpoint.')
+            raise NextCloudTalkNotCapable(
+                reason='Unable to determine active Conversation endpoint.')
 
-        if 'chat-v2' in await self.get_capabilities(TALK_CAPS):
-            self.chat_stub = '/ocs/v2.php/apps/spreed/api/v1'
+        if 'chat-v2' in features:
+            self.chat_stub = CHAT_STUB
         else:
-            raise NextCloudTalkNotCapable('Unable to determine chat endpoint.')
+            raise NextCloudTalkNotCapable(reason='Unable to determine chat endpoint.')
+
+        self.__talk_features = features
+
+    async def __prepare(self, *features: str) -> None:
+        """Resolve endpoint stubs and check for any required Talk `features`.
+
+        The server's Talk capabilities are fetched once, on first use, and
+        shared by concurrent callers.
+        """
+        if self.__talk_features is None:
+            if self.__inflight_stubs is None:
+                self.__inflight_stubs = {}
+            await single_flight(self.__inflight_stubs, TALK_CAPS, self.__get_stubs)
+
+        for feature in features:
+            self.__require_talk_feature(feature)
+
+    def __require_talk_feature(self, feature: str) -> None:
+        """Raise NextCloudTalkNotCapable unless the server supports `feature`."""
+        if feature not in self.__talk_features:
+            raise NextCloudTalkNotCapable(
+                reason=f'Server does not support required capability: {feature}')
+
+    async def __update_conversation(self, token: str, **kwargs) -> Any:
+        """Send a write for conversation `token` through ocs_query().
+
+        Once the write succeeds, a get_conversation() already in flight for
+        `token` is no longer shared, so later reads see the change.
+        """
+        response = await self.ocs_query(**kwargs)
+        if self.__inflight_conversations is not None:
+            self.__inflight_conversations.pop(token, None)
+        return response
 
     async def get_conversations(
             self,
@@ -52,8 +131,7 @@ class NextCloudTalkAPI(object):
         #### Exceptions:
         401 Unauthorized when the user is not logged in
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
         data = {
             'noStatusUpdate': 1 if status_update else 0,
@@ -95,11 +173,10 @@ class NextCloudTalkAPI(object):
 
         404 Not Found When the target to invite does not exist
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
         data = {
-            'roomType': ConversationType[room_type].value,
+            'roomType': CONVERSATION_TYPES[room_type],
             'invite': invite,
             'source': source,
             'roomName': room_name
@@ -115,20 +192,51 @@ class NextCloudTalkAPI(object):
         Method: GET
         Endpoint: /room/{token}
 
+        Concurrent requests for the same token share a single HTTP request.
+        Each caller receives its own copy of the result.
+
         #### Exceptions:
         404 Not Found When the conversation could not be found for the participant
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
+
+        if self.__inflight_conversations is None:
+            self.__inflight_conversations = {}
+
+        room = await single_flight(
+            self.__inflight_conversations,
+            room_token,
+            lambda: self.ocs_query(sub=f'{self.conv_stub}/room/{room_token}'))
+        return copy.deepcopy(room)
+
+    async def get_conversations_by_token(
+            self,
+            tokens: List[str],
+            concurrency: int = BULK_CONCURRENCY) -> List[Dict]:
+        """Get several specific conversations at once.
+
+        Up to `concurrency` requests are issued at a time.  A conversation that
+        cannot be fetched does not fail the whole batch: its exception is
+        returned in its place instead.
+
+        #### Arguments:
+        tokens	[List[str]]	Conversation tokens
+
+        concurrency	[int]	Maximum simultaneous requests
+
+        #### Returns:
+        List of conversations or exceptions, in the order of `tokens`.
+        """
+        await self.__prepare()
 
-        room_data = await self.ocs_query(
-            sub=f'{self.conv_stub}/room/{room_token}')
-        return room_data
+        return await gather_limited(
+            concurrency,
+            *(self.get_conversation(token) for token in tokens),
+            return_exceptions=True)
 
     async def get_open_conversation_list(self) -> List[Dict]:
         """Get list of open rooms."""
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
         return await self.ocs_query(method='GET', sub=f'{self.conv_stub}/listed-room')
 
@@ -151,10 +259,10 @@ class NextCloudTalkAPI(object):
         404 Not Found When the conversation could not be found for the
             participant
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
-        return await self.ocs_query(
+        return await self.__update_conversation(
+            token,
             method='PUT',
             sub=f'{self.conv_stub}/room/{token}',
             data={'roomName': new_name})
@@ -174,10 +282,10 @@ class NextCloudTalkAPI(object):
         404 Not Found When the conversation could not be found for the
             participant
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
-        return await self.ocs_query(
+        return await self.__update_conversation(
+            token,
             method='DELETE',
             sub=f'{self.conv_stub}/room/{token}')
 
@@ -202,13 +310,10 @@ class NextCloudTalkAPI(object):
 
         NextCloudTalkNotCapable When server is lacking required capability
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
-
-        if 'room-description' not in await self.get_capabilities(TALK_CAPS):
-            raise NextCloudTalkNotCapable('Server does not support setting room descriptions')
+        await self.__prepare('room-description')
 
-        response = await self.ocs_query(
+        response = await self.__update_conversation(
+            token,
             method='PUT',
             sub=f'{self.conv_stub}/room/{token}/description',
             data={'description': description})
@@ -231,15 +336,16 @@ class NextCloudTalkAPI(object):
 
         404 Not Found When the conversation could not be found for the participant
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
         if allow_guests:
-            return await self.ocs_query(
+            return await self.__update_conversation(
+                token,
                 method='POST',
                 sub=f'{self.conv_stub}/room/{token}/public')
         else:
-            return await self.ocs_query(
+            return await self.__update_conversation(
+                token,
                 method='DELETE',
                 sub=f'{self.conv_stub}/room/{token}/public')
 
@@ -265,13 +371,10 @@ class NextCloudTalkAPI(object):
 
         NextCloudTalkNotCapable When server is lacking required capability
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
-
-        if 'read-only-rooms' not in await self.get_capabilies(TALK_CAPS):
-            raise NextCloudTalkNotCapable('Server doesn\'t support read-only rooms.')
+        await self.__prepare('read-only-rooms')
 
-        return await self.ocs_query(
+        return await self.__update_conversation(
+            token,
             method='PUT',
             sub=f'{self.conv_stub}/room/{token}/read-only',
             data={'state': state})
@@ -292,14 +395,69 @@ class NextCloudTalkAPI(object):
 
         404 Not Found When the conversation could not be found for the participant
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
-        return await self.ocs_query(
+        return await self.__update_conversation(
+            token,
             method='PUT',
             sub=f'{self.conv_stub}/room/{token}/password',
             data={'password': password})
 
+    async def configure_conversation(
+            self,
+            token: str,
+            new_name: Optional[str] = None,
+            description: Optional[str] = None,
+            password: Optional[str] = None,
+            scope: Optional[str] = None,
+            default_permissions: Optional[Permissions] = None) -> Dict[str, Any]:
+        """Apply several conversation settings at once.
+
+        Each given setting is its own request; they do not depend on one
+        another, so they are sent concurrently and the wall time is that of
+        the slowest request rather than the sum of all of them.
+
+        #### Arguments:
+        new_name	[str]	See rename_conversation()
+
+        description	[str]	See set_conversation_description()
+
+        password	[str]	See set_conversation_password()
+
+        scope	[str]	See set_conversation_scope()
+
+        default_permissions	[Permissions]	See set_participant_permissions()
+
+        #### Exceptions:
+        NextCloudTalkBadRequest When `scope` is not a valid ListableScope name.  Nothing
+        is sent in that case.
+
+        #### Returns:
+        Dict keyed by argument name, for the settings that were given.  Each value is
+        that setting's response, or the exception it raised, so one failed setting
+        does not hide which of the others were applied.
+        """
+        if scope is not None and scope not in LISTABLE_SCOPES:
+            raise NextCloudTalkBadRequest(reason=f'Invalid conversation scope: {scope}')
+
+        await self.__prepare()
+
+        reqs = {}
+        if new_name is not None:
+            reqs['new_name'] = self.rename_conversation(token, new_name)
+        if description is not None:
+            reqs['description'] = self.set_conversation_description(token, description)
+        if password is not None:
+            reqs['password'] = self.set_conversation_password(token, password)
+        if scope is not None:
+            reqs['scope'] = self.set_conversation_scope(token, scope)
+        if default_permissions is not None:
+            reqs['default_permissions'] = self.set_participant_permissions(
+                token, scope='default', permissions=default_permissions)
+
+        results = await asyncio.gather(*reqs.values(), return_exceptions=True)
+        return dict(zip(reqs, results))
+
     async def add_conversation_to_favorites(self, token) -> Dict:
         """Add conversation to favorites
 
@@ -314,13 +472,10 @@ class NextCloudTalkAPI(object):
 
         NextCloudTalkNotCapable When server is lacking required capability
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
-
-        if 'favorites' not in await self.get_capabilities(TALK_CAPS):
-            raise NextCloudTalkNotCapable('Server does not support user favorites.')
+        await self.__prepare('favorites')
 
-        return await self.ocs_query(
+        return await self.__update_conversation(
+            token,
             method='POST',
             sub=f'{self.conv_stub}/room/{token}/favorite')
 
@@ -338,13 +493,10 @@ class NextCloudTalkAPI(object):
 
         NextCloudTalkNotCapable When server is lacking required capability
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
-
-        if 'favorites' not in await self.get_capabilities(TALK_CAPS):
-            raise NextCloudTalkNotCapable('Server does not support user favorites.')
+        await self.__prepare('favorites')
 
-        return await self.ocs_query(
+        return await self.__update_conversation(
+            token,
             method='DELETE',
             sub=f'{self.conv_stub}/room/{token}/favorites')
 
@@ -368,13 +520,13 @@ class NextCloudTalkAPI(object):
 
         404 Not Found When the conversation could not be found for the participant
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
         data = {
-            'level': NotificationLevel[notification_level].value
+            'level': NOTIFICATION_LEVELS[notification_level]
         }
-        return await self.ocs_query(
+        return await self.__update_conversation(
+            token,
             method='POST',
             sub=f'{self.conv_stub}/room/{token}/notify',
             data=data)
@@ -401,17 +553,13 @@ class NextCloudTalkAPI(object):
 
         NextCloudTalkNotCapable When server is lacking required capability
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
-
-        if 'notification-calls' not in await self.get_capabilities(TALK_CAPS):
-            raise NextCloudTalkNotCapable(
-                'Server does not support setting call notification levels.')
+        await self.__prepare('notification-calls')
 
         data = {
-            'level': NotificationLevel[notification_level].value
+            'level': NOTIFICATION_LEVELS[notification_level]
         }
-        return await self.ocs_query(
+        return await self.__update_conversation(
+            token,
             method='POST',
             sub=f'{self.conv_stub}/room/{token}/notify-calls',
             data=data)
@@ -446,14 +594,14 @@ class NextCloudTalkAPI(object):
 
         404 Not Found When the conversation could not be found for the participant
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
         data = {
             'mode': scope,
-            'permissions': permissions,
+            'permissions': int(permissions),
         }
-        return await self.ocs_query(
+        return await self.__update_conversation(
+            token,
             method='PUT',
             sub=f'{self.conv_stub}/room/{token}/permissions/{scope}',
             data=data)
@@ -497,14 +645,14 @@ class NextCloudTalkAPI(object):
 
         lastPing	[int]   Timestamp of the last ping of the conflicting session
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
         data = {
             'password': password,
             'force': force,
         }
-        return await self.ocs_query(
+        return await self.__update_conversation(
+            token,
             method='POST',
             sub=f'{self.conv_stub}/room/{token}/participants/active',
             data=data)
@@ -521,10 +669,10 @@ class NextCloudTalkAPI(object):
 
         404 Not Found When the conversation could not be found for the participant
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
-        return await self.ocs_query(
+        return await self.__update_conversation(
+            token,
             method='DELETE',
             sub=f'{self.conv_stub}/room/{token}/participants/self')
 
@@ -570,10 +718,11 @@ class NextCloudTalkAPI(object):
             returned
 
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
-        return await self.ocs_query(
+        return await self.__update_conversation(
+            token,
+            method='POST',
             sub=f'{self.conv_stub}/room/{token}/participants',
             data={'newParticipant': invitee, 'source': source})
 
@@ -582,8 +731,7 @@ class NextCloudTalkAPI(object):
             token: str,
             include_status: bool = False) -> List[Dict]:
         """Return list of participants."""
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
         return await self.ocs_query(
             sub=f'{self.conv_stub}/room/{token}/participants',
@@ -638,10 +786,10 @@ class NextCloudTalkAPI(object):
                                         has it set to private the value the header is not
                                         set (only available with chat-read-status capability)
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
-        response = await self.ocs_query(
+        response = await self.__update_conversation(
+            token,
             method='POST',
             sub=f'{self.chat_stub}/chat/{token}',
             data={
@@ -651,7 +799,7 @@ class NextCloudTalkAPI(object):
                 "referenceId": reference_id,
                 "silent": silent
             },
-            include_headers=['X-Chat-Last-Common-Read'])
+            include_headers=LAST_COMMON_READ_HEADERS)
 
         return response
 
@@ -679,16 +827,13 @@ class NextCloudTalkAPI(object):
 
         NextCloudTalkNotCapable When server is lacking required capability
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare('listable-rooms')
 
-        if 'listable-rooms' not in await self.get_capabilities(TALK_CAPS):
-            raise NextCloudTalkNotCapable('Server does not support listable rooms.')
-
-        response = await self.ocs_query(
+        response = await self.__update_conversation(
+            token,
             method='PUT',
             sub=f'{self.conv_stub}/room/{token}/listable',
-            data={'scope': ListableScope[scope].value})
+            data={'scope': LISTABLE_SCOPES[scope]})
 
         return response
 
@@ -721,14 +866,14 @@ class NextCloudTalkAPI(object):
 
         404 Not Found When the conversation could not be found for the participant
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
         data = {
             'mode': mode,
-            'permissions': permissions.value,
+            'permissions': int(permissions),
         }
-        return await self.ocs_query(
+        return await self.__update_conversation(
+            token,
             method='PUT',
             sub=f'{self.conv_stub}/room/{token}/attendees/permissions/all',
             data=data)
@@ -752,10 +897,10 @@ class NextCloudTalkAPI(object):
         404 Not Found When the conversation could not be found for the
         participant
         """
-        return await self.ocs_query(
+        return await self.__update_conversation(
+            token,
             method='POST',
-            url=f'{self.endpoint}/ocs/v2.php/apps/spreed/api/v1',
-            sub=f'{self.conv_stub}/guest/{token}/name',
+            sub=f'{CHAT_STUB}/guest/{token}/name',
             data={'displayName': display_name})
 
     async def get_conversation_messages(
@@ -847,14 +992,13 @@ class NextCloudTalkAPI(object):
         reactionsSelf	[array]	Optional: When the user reacted this is the list of emojis
         the user reacted with
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
         data = {
             'lookIntoFuture': 1 if look_into_future else 0,
             'limit': limit,
             'timeout': timeout,
-            'setReadMaker': 1 if set_read_marker else 0,
+            'setReadMarker': 1 if set_read_marker else 0,
             'includeLastKnown': 1 if include_last_known else 0
         }
         if last_known_message:
@@ -866,10 +1010,53 @@ class NextCloudTalkAPI(object):
             method='GET',
             sub=f'{self.chat_stub}/chat/{token}',
             data=data,
-            include_headers=['X-Chat-Last-Given', 'X-Chat-Last-Common-Read']
+            include_headers=CHAT_PAGING_HEADERS
         )
         return response, headers
 
+    async def iter_conversation_messages(
+            self,
+            token: str,
+            limit: int = 100,
+            last_known_message: Optional[int] = None) -> AsyncIterator[Dict]:
+        """Iterate over the chat history of a conversation, newest first.
+
+        Pages are requested with get_conversation_messages() and followed via
+        the X-Chat-Last-Given header.  The next page is requested as soon as
+        the current one arrives, so its round-trip overlaps with the caller
+        processing the current page.  The read marker is left untouched.
+
+        #### Arguments:
+        limit	[int]	Number of chat messages per page (100 by default, 200 at most)
+
+        last_known_message	[int]	Start paging before this message ID
+        """
+        async def fetch_page(last_known: Optional[int]):
+            try:
+                return await self.get_conversation_messages(
+                    token,
+                    limit=limit,
+                    last_known_message=last_known,
+                    set_read_marker=False)
+            except NextCloudNotModified:
+                return [], {}
+
+        next_page = asyncio.ensure_future(fetch_page(last_known_message))
+        try:
+            while next_page:
+                messages, headers = await next_page
+                last_given = headers.get('X-Chat-Last-Given')
+                if messages and last_given:
+                    next_page = asyncio.ensure_future(fetch_page(int(last_given)))
+                else:
+                    next_page = None
+
+                for message in messages:
+                    yield message
+        finally:
+            if next_page:
+                next_page.cancel()
+
     async def send_rich_object_to_conversation(
             self,
             token: str,
@@ -916,20 +1103,20 @@ class NextCloudTalkAPI(object):
         The full message array of the new message, as defined in Receive chat messages
         of a conversation
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
-        response = await self.ocs_query(
+        response = await self.__update_conversation(
+            token,
             method='POST',
             sub=f'{self.chat_stub}/chat/{token}/share',
             data={
                 'objectType': rich_object.object_type,
                 'objectId': rich_object.id,
-                'metaData': json.dumps(rich_object.metadata),
+                'metaData': json_dumps(rich_object.metadata),
                 'actorDisplayName': actor_display_name,
                 'referenceId': reference_id
             },
-            include_headers=['X-Chat-Last-Common-Read']
+            include_headers=LAST_COMMON_READ_HEADERS
         )
         return response
 
@@ -956,16 +1143,13 @@ class NextCloudTalkAPI(object):
         rendering this message the client should also remove all messages from any
         cache/storage of the device.
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
-
-        if 'clear-history' not in await self.get_capabilities(TALK_CAPS):
-            raise NextCloudTalkNotCapable('Server does not support deletion of chat history.')
+        await self.__prepare('clear-history')
 
-        response = await self.ocs_query(
+        response = await self.__update_conversation(
+            token,
             method='DELETE',
             sub=f'{self.chat_stub}/chat/{token}',
-            include_headers=['X-Chat-Last-Common-Read'],
+            include_headers=LAST_COMMON_READ_HEADERS,
         )
         return response
 
@@ -974,7 +1158,7 @@ class NextCloudTalkAPI(object):
             token: str,
             search: str,
             limit: int = 20,
-            include_status: bool = False) -> Dict:
+            include_status: bool = False) -> List[Dict]:
         """Get mention autocomplete suggestions
 
         Method: GET
@@ -1014,17 +1198,30 @@ class NextCloudTalkAPI(object):
 
         statusMessage	[str]	Optional: Only available with includeStatus=true and for
         users with a set status
-        """
-        if not self.conv_stub:
-            await self.__get_stubs()
 
-        return await self.ocs_query(
-            method='GET',
-            sub=f'{self.chat_stub}/chat/{token}/mentions',
-            data={
-                'search': search,
-                'limit': limit,
-                'includeStatus': include_status})
+        Results are cached for AUTOCOMPLETE_CACHE_TTL seconds per
+        (token, search, limit, include_status).  Each call returns its own copy.
+        """
+        await self.__prepare()
+
+        if self.__suggestion_cache is None:
+            self.__suggestion_cache = TTLCache(
+                ttl=AUTOCOMPLETE_CACHE_TTL,
+                maxsize=AUTOCOMPLETE_CACHE_SIZE)
+
+        key = (token, search, limit, include_status)
+        suggestions = self.__suggestion_cache.get(key)
+        if suggestions is None:
+            suggestions = await self.ocs_query(
+                method='GET',
+                sub=f'{self.chat_stub}/chat/{token}/mentions',
+                data={
+                    'search': search,
+                    'limit': limit,
+                    'includeStatus': include_status})
+            self.__suggestion_cache.set(key, suggestions)
+
+        return copy.deepcopy(suggestions)
 
     async def share_file_to_conversation(
             self,
@@ -1053,20 +1250,18 @@ class NextCloudTalkAPI(object):
         #### Exceptions:
         403 When path is already shared
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
-        response = await self.ocs_query(
+        response = await self.__update_conversation(
+            token,
             method='POST',
-            url=f'{self.endpoint}/ocs/v2.php/apps/files_sharing/api/v1/shares',
+            sub=SHARES_STUB,
             data={
                 'shareType': 10,
                 'shareWith': token,
                 'path': path,
                 'reference_id': reference_id,
-                'talkMetaData': json.dumps(
-                    {'messageType': metadata_type}
-                )
+                'talkMetaData': _talk_metadata(metadata_type)
             }
         )
         return response
@@ -1097,14 +1292,41 @@ class NextCloudTalkAPI(object):
 
         404 Not Found When the participant to remove could not be found
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
-        return await self.ocs_query(
+        return await self.__update_conversation(
+            token,
             method='DELETE',
             sub=f'{self.conv_stub}/room/{token}/attendees',
             data={'attendeeId': attendee_id})
 
+    async def remove_participants_from_conversation(
+            self,
+            token: str,
+            attendee_ids: List[int],
+            concurrency: int = BULK_CONCURRENCY) -> List[Dict]:
+        """Delete several attendees from a conversation at once.
+
+        Up to `concurrency` requests are issued at a time.  An attendee that
+        cannot be removed does not fail the whole batch: its exception (see
+        remove_participant_from_conversation()) is returned in its place.
+
+        #### Arguments:
+        attendee_ids	[List[int]]	The participants to delete
+
+        concurrency	[int]	Maximum simultaneous requests
+
+        #### Returns:
+        List of responses or exceptions, in the order of `attendee_ids`.
+        """
+        await self.__prepare()
+
+        return await gather_limited(
+            concurrency,
+            *(self.remove_participant_from_conversation(token=token, attendee_id=attendee_id)
+              for attendee_id in attendee_ids),
+            return_exceptions=True)
+
     async def promote_conversation_participant(
             self,
             token: str,
@@ -1130,10 +1352,10 @@ class NextCloudTalkAPI(object):
 
         404 Not Found When the participant to remove could not be found
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
-        return await self.ocs_query(
+        return await self.__update_conversation(
+            token,
             method='POST',
             sub=f'{self.conv_stub}/room/{token}/moderators',
             data={'attendeeId': attendee_id})
@@ -1162,12 +1384,12 @@ class NextCloudTalkAPI(object):
 
         404 Not Found When the participant to demote could not be found
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
-        return await self.ocs_query(
+        return await self.__update_conversation(
+            token,
             method='DELETE',
-            sub=f'{self.conv_stub}/room/{self.room.token}/moderators',
+            sub=f'{self.conv_stub}/room/{token}/moderators',
             data={'attendeeId': attendee_id})
 
     async def set_conversation_participant_permissions(
@@ -1207,15 +1429,15 @@ class NextCloudTalkAPI(object):
 
         404 Not Found When the attendee to set publishing permissions could not be found
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
         data = {
             'attendeeId': attendee_id,
             'mode': mode,
-            'permissions': permissions.value
+            'permissions': int(permissions)
         }
-        return await self.ocs_query(
+        return await self.__update_conversation(
+            token,
             method='PUT',
             sub=f'{self.conv_stub}/room/{token}/attendees/permissions',
             data=data
@@ -1253,19 +1475,13 @@ class NextCloudTalkAPI(object):
         displayed to the user but instead be used to remove the original message from any
         cache/storage of the device.
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
-
-        if 'rich-object-delete' not in await self.get_capabilities(TALK_CAPS):
-            raise NextCloudTalkNotCapable('Server does not support deletion of rich objects.')
-        else:
-            if 'delete-messages' not in await self.get_capabilities(TALK_CAPS):
-                raise NextCloudTalkNotCapable('Server does not support message deletion.')
+        await self.__prepare('rich-object-delete', 'delete-messages')
 
-        response = await self.ocs_query(
+        response = await self.__update_conversation(
+            token,
             method='DELETE',
             sub=f'{self.chat_stub}/chat/{token}/{message_id}',
-            include_headers=['X-Chat-Last-Common-Read'])
+            include_headers=LAST_COMMON_READ_HEADERS)
 
         return response
 
@@ -1290,8 +1506,67 @@ class NextCloudTalkAPI(object):
         X-Chat-Last-Common-Read	[int]	ID of the last message read by every user that
         has read privacy set to public. When the user themself has it set to private the
         value the header is not set (only available with chat-read-status capability)
+
+        #### Coalescing:
+        Calls for the same conversation made within `read_marker_delay` seconds
+        of the first are sent as one request for the highest message ID.  Every
+        caller receives the response of that request.  A pending read marker is
+        sent before any later mark_conversation_message_unread() for the same
+        conversation, so calls still take effect in the order they were made.
         """
-        await self.__mark_message_status(token=token, message_id=message_id, read=True)
+        if self.__pending_read_markers is None:
+            self.__pending_read_markers = {}
+
+        pending = self.__pending_read_markers.get(token)
+        if pending is None:
+            pending = {'message_id': message_id, 'flush': asyncio.Event()}
+            pending['task'] = asyncio.ensure_future(self.__flush_read_marker(token, pending))
+            self.__pending_read_markers[token] = pending
+        else:
+            pending['message_id'] = max(pending['message_id'], message_id)
+
+        return await asyncio.shield(pending['task'])
+
+    async def mark_conversations_read(
+            self,
+            markers: Dict[str, int],
+            concurrency: int = BULK_CONCURRENCY) -> List[Dict]:
+        """Mark several conversations as read at once.
+
+        Read markers for different conversations are independent, so up to
+        `concurrency` of them are sent at a time.  A conversation that cannot
+        be marked does not fail the whole batch: its exception is returned in
+        its place instead.  See mark_conversation_message_read().
+
+        #### Arguments:
+        markers	[Dict[str, int]]	Last read message ID, keyed by conversation token
+
+        concurrency	[int]	Maximum simultaneous requests
+
+        #### Returns:
+        List of responses or exceptions, in the order of `markers`.
+        """
+        await self.__prepare()
+
+        return await gather_limited(
+            concurrency,
+            *(self.mark_conversation_message_read(token=token, message_id=message_id)
+              for token, message_id in markers.items()),
+            return_exceptions=True)
+
+    async def __flush_read_marker(self, token: str, pending: Dict) -> Dict:
+        flush = asyncio.ensure_future(pending['flush'].wait())
+        try:
+            await asyncio.wait([flush], timeout=self.read_marker_delay)
+        finally:
+            flush.cancel()
+            if self.__pending_read_markers.get(token) is pending:
+                del self.__pending_read_markers[token]
+
+        return await self.__mark_message_status(
+            token=token,
+            message_id=pending['message_id'],
+            read=True)
 
     async def mark_conversation_message_unread(
             self,
@@ -1312,6 +1587,12 @@ class NextCloudTalkAPI(object):
         privacy set to public. When the user themself has it set to private the value the
         header is not set (only available with chat-read-status capability)
         """
+        pending = (self.__pending_read_markers or {}).pop(token, None)
+        if pending is not None:
+            # Send the earlier read marker first so it cannot overwrite this one.
+            pending['flush'].set()
+            await asyncio.wait([pending['task']])
+
         return await self.__mark_message_status(token=token, message_id=message_id, read=False)
 
     async def __mark_message_status(
@@ -1320,14 +1601,14 @@ class NextCloudTalkAPI(object):
             message_id: int,
             read: bool) -> Dict:
 
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
-        response = await self.ocs_query(
+        response = await self.__update_conversation(
+            token,
             method='POST' if read else 'DELETE',
             sub=f'{self.chat_stub}/chat/{token}/read',
-            data={'lastReadMessage': {message_id}},
-            include_headers=['X-Chat-Last-Common-Read']
+            data={'lastReadMessage': message_id},
+            include_headers=LAST_COMMON_READ_HEADERS
         )
         return response
 
@@ -1350,8 +1631,7 @@ class NextCloudTalkAPI(object):
 
         #### Response Data (As Message() object attributes):
         """
-        if not self.conv_stub:
-            await self.__get_stubs()
+        await self.__prepare()
 
         data = {
             'limit': limit,
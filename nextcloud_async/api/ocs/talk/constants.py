@@ -3,7 +3,10 @@
 https://nextcloud-talk.readthedocs.io/en/latest/constants/
 """
 
+import operator
+
 from enum import IntFlag, Enum
+from functools import reduce
 
 
 class ConversationType(Enum):
@@ -59,6 +62,18 @@ class Permissions(IntFlag):
     can_publish_screen_sharing = 64
 
 
+def permissions_mask(*flags: Permissions) -> int:
+    """Combine permission flags into a plain integer mask.
+
+    ORs the flags as ints rather than going through IntFlag, which rebuilds
+    a pseudo-member for every composite value.
+
+    >>> permissions_mask(Permissions.start_call, Permissions.join_call)
+    6
+    """
+    return reduce(operator.or_, map(int, flags), 0)
+
+
 class ParticipantType(Enum):
     """Participant Types."""
 
@@ -9,16 +9,51 @@ and entered into the chat.
 """
 
 
+__all__ = (
+    'NextCloudTalkRichObject',
+    'AddressBook',
+    'AddressBookContact',
+    'Announcement',
+    'Calendar',
+    'CalendarEvent',
+    'Call',
+    'Circle',
+    'DeckBoard',
+    'DeckCard',
+    'Email',
+    'File',
+    'Form',
+    'GeoLocation',
+    'TalkAttachment',
+    'User',
+    'UserGroup',
+)
+
+
 class NextCloudTalkRichObject(object):
     """Base Class for Rich Objects."""
 
+    __slots__ = ('id', 'name', 'properties')
+
     object_type = None
 
     def __init__(self, id: str, name: str, **kwargs):
-        """Set object metadata."""
-        self.__dict__.update(kwargs)
+        """Set object metadata.
+
+        Any other properties are kept in `properties` and can also be read as
+        attributes.
+        """
         self.id = id
         self.name = name
+        self.properties = kwargs
+
+    def __getattr__(self, attr):
+        """Look up `attr` among the extra properties."""
+        try:
+            return object.__getattribute__(self, 'properties')[attr]
+        except KeyError:
+            raise AttributeError(
+                f'{type(self).__name__!r} object has no attribute {attr!r}') from None
 
     @property
     def metadata(self):
@@ -29,38 +64,54 @@ class NextCloudTalkRichObject(object):
 class AddressBook(NextCloudTalkRichObject):
     """Address book."""
 
+    __slots__ = ()
+
     object_type = 'addressbook'
 
 
 class AddressBookContact(NextCloudTalkRichObject):
     """Addressbook contact."""
 
+    __slots__ = ()
+
     object_type = 'addressbook-contact'
 
 
 class Announcement(NextCloudTalkRichObject):
     """Announcement."""
 
+    __slots__ = ()
+
     object_type = 'announcement'
 
 
 class Calendar(NextCloudTalkRichObject):
     """Calendar."""
 
+    __slots__ = ()
+
     object_type = 'calendar'
 
 
 class CalendarEvent(NextCloudTalkRichObject):
     """Calendar Event."""
 
+    __slots__ = ()
+
     object_type = 'calendar-event'
 
 
 class Call(NextCloudTalkRichObject):
     """Nextcloud Talk Call."""
 
+    __slots__ = ('call_type',)
+
     object_type = 'call'
-    call_type = ''
+
+    def __init__(self, id: str, name: str, call_type: str = ''):
+        """Set call metadata."""
+        super().__init__(id, name)
+        self.call_type = call_type
 
     @property
     def metadata(self):
@@ -75,32 +126,41 @@ class Call(NextCloudTalkRichObject):
 class Circle(NextCloudTalkRichObject):
     """Cirle."""
 
+    __slots__ = ()
+
     object_type = 'circle'
 
 
 class DeckBoard(NextCloudTalkRichObject):
     """Deck board."""
 
+    __slots__ = ()
+
     object_type = 'deck-board'
 
 
 class DeckCard(NextCloudTalkRichObject):
     """Deck card."""
 
+    __slots__ = ()
+
     object_type = 'deck-card'
 
 
 class Email(NextCloudTalkRichObject):
     """E-mail."""
 
+    __slots__ = ()
+
     object_type = 'email'
 
 
 class File(NextCloudTalkRichObject):
     """File."""
 
+    __slots__ = ('path',)
+
     object_type = 'file'
-    path = ''
 
     allowed_props = ['size', 'link', 'mimetype', 'preview-available', 'mtime']
 
@@ -110,40 +170,39 @@ class File(NextCloudTalkRichObject):
         if not all(key in self.allowed_props for key in kwargs):
             raise ValueError(f'Supported properties {self.allowed_props}')
 
-        init = {
-            'id': name,
-            'name': name,
-            'path': path,
-        }
-        data = { **init, **kwargs }
-        super().__init__(**data)
+        super().__init__(name, name, **kwargs)
+        self.path = path
 
     @property
     def metadata(self):
         """Return object metadata."""
-        return self.__dict__
+        return {
+            'id': self.id,
+            'name': self.name,
+            'path': self.path,
+            **self.properties
+        }
 
 class Form(NextCloudTalkRichObject):
     """Form."""
 
+    __slots__ = ()
+
     object_type = 'forms-form'
 
 
 class GeoLocation(NextCloudTalkRichObject):
     """Geo-location."""
 
+    __slots__ = ('latitude', 'longitude')
+
     object_type = 'geo-location'
-    latitude = None
-    longitude = None
 
     def __init__(self, name: str, latitude: str, longitude: str):
         """Set Geolocation metadata."""
-        data = {
-            'id': f'geo:{latitude},{longitude}',
-            'name': name,
-            'longitude': longitude,
-            'latitude': latitude}
-        super().__init__(**data)
+        super().__init__(f'geo:{latitude},{longitude}', name)
+        self.latitude = latitude
+        self.longitude = longitude
 
     def __str__(self):
         return f'{__class__.__name__}'\
@@ -163,16 +222,22 @@ class GeoLocation(NextCloudTalkRichObject):
 class TalkAttachment(NextCloudTalkRichObject):
     """Talk Attachment."""
 
+    __slots__ = ()
+
     object_type = 'talk-attachment'
 
 
 class User(NextCloudTalkRichObject):
     """User."""
 
+    __slots__ = ()
+
     object_type = 'user'
 
 
 class UserGroup(NextCloudTalkRichObject):
     """User group."""
 
+    __slots__ = ()
+
     object_type = 'user-group'
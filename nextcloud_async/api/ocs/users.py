@@ -7,6 +7,9 @@ import asyncio
 from typing import Optional, List, Dict
 from nextcloud_async.api.ocs.shares import ShareType
 
+USERS_STUB = '/ocs/v1.php/cloud/users'
+DEFAULT_SHARE_TYPES = (ShareType.user.value,)
+
 
 class UserManager():
     """Manage users on a Nextcloud instance."""
@@ -18,8 +21,8 @@ class UserManager():
             email: str,
             quota: str,
             language: str,
-            groups: List = [],
-            subadmin: List = [],
+            groups: Optional[List] = None,
+            subadmin: Optional[List] = None,
             password: Optional[str] = None) -> Dict[str, str]:
         """Create a new Nextcloud user.
 
@@ -50,18 +53,21 @@ class UserManager():
                 { 'id': 'YourNewUser' }
 
         """
+        data = {
+            'userid': user_id,
+            'displayName': display_name,
+            'email': email,
+            'groups': groups or [],
+            'subadmin': subadmin or [],
+            'language': language,
+            'quota': quota}
+        if password is not None:
+            data['password'] = password
+
         return await self.ocs_query(
             method='POST',
-            sub='/ocs/v1.php/cloud/users',
-            data={
-                'userid': user_id,
-                'displayName': display_name,
-                'email': email,
-                'groups': groups,
-                'subadmin': subadmin,
-                'language': language,
-                'quota': quota,
-                'password': password})
+            sub=USERS_STUB,
+            data=data)
 
     async def search_users(
             self,
@@ -85,7 +91,7 @@ class UserManager():
         """
         response = await self.ocs_query(
             method='GET',
-            sub='/ocs/v1.php/cloud/users',
+            sub=USERS_STUB,
             data={
                 'search': search,
                 'limit': limit,
@@ -106,7 +112,7 @@ class UserManager():
         """
         if not user_id:
             user_id = self.user
-        return await self.ocs_query(method='GET', sub=f'/ocs/v1.php/cloud/users/{user_id}')
+        return await self.ocs_query(method='GET', sub=f'{USERS_STUB}/{user_id}')
 
     async def get_users(self) -> List[str]:
         """Return all user IDs.
@@ -118,7 +124,7 @@ class UserManager():
             List: User IDs
 
         """
-        response = await self.ocs_query(method='GET', sub=r'/ocs/v1.php/cloud/users')
+        response = await self.ocs_query(method='GET', sub=USERS_STUB)
         return response['users']
 
     async def user_autocomplete(
@@ -127,7 +133,7 @@ class UserManager():
             item_type: Optional[str] = None,
             item_id: Optional[str] = None,
             sorter: Optional[str] = None,
-            share_types: Optional[List[ShareType]] = [ShareType['user']],
+            share_types: Optional[List[ShareType]] = None,
             limit: int = 25) -> List[Dict[str, str]]:
         """Search for a user using incomplete information.
 
@@ -159,7 +165,11 @@ class UserManager():
             list: Potential matches
 
         """
-        share_types_values = [x.value for x in share_types]
+        if share_types is None:
+            share_types_values = DEFAULT_SHARE_TYPES
+        else:
+            share_types_values = [int(x) for x in share_types]
+
         return await self.ocs_query(
             method='GET',
             sub='/ocs/v2.php/core/autocomplete/get',
@@ -190,16 +200,20 @@ class UserManager():
             list: Responses
 
         """
+        sub = f'{USERS_STUB}/{user_id}'
         reqs = []
         for k, v in new_data.items():
-            reqs.append(self.__update_user(user_id, k, v))
+            reqs.append(self.__update_user(sub, k, v))
+
+        if len(reqs) == 1:
+            return [await reqs[0]]
 
         return await asyncio.gather(*reqs)
 
-    async def __update_user(self, user_id, k, v) -> List[str]:
+    async def __update_user(self, sub, k, v) -> List[str]:
         return await self.ocs_query(
             method='PUT',
-            sub=f'/ocs/v1.php/cloud/users/{user_id}',
+            sub=sub,
             data={'key': k, 'value': v})
 
     async def get_user_editable_fields(self):
@@ -230,7 +244,7 @@ class UserManager():
         """
         return await self.ocs_query(
             method='PUT',
-            sub=f'/ocs/v1.php/cloud/users/{user_id}/disable')
+            sub=f'{USERS_STUB}/{user_id}/disable')
 
     async def enable_user(self, user_id: str) -> List[str]:
         """Enable `user_id`.  Must be admin.
@@ -246,7 +260,7 @@ class UserManager():
         """
         return await self.ocs_query(
             method='PUT',
-            sub=f'/ocs/v1.php/cloud/users/{user_id}/enable')
+            sub=f'{USERS_STUB}/{user_id}/enable')
 
     async def remove_user(self, user_id: str) -> List[str]:
         """Remove existing `user_id`.
@@ -262,7 +276,7 @@ class UserManager():
         """
         return await self.ocs_query(
             method='DELETE',
-            sub=f'/ocs/v1.php/cloud/users/{user_id}')
+            sub=f'{USERS_STUB}/{user_id}')
 
     async def get_user_groups(self, user_id: Optional[str] = None) -> List[str]:
         """Get list of groups `user_id` belongs to.
@@ -278,7 +292,7 @@ class UserManager():
         """
         response = await self.ocs_query(
             method='GET',
-            sub=f'/ocs/v1.php/cloud/users/{user_id or self.user}/groups')
+            sub=f'{USERS_STUB}/{user_id or self.user}/groups')
         return response['groups']
 
     async def add_user_to_group(self, user_id: str, group_id: str) -> List[str]:
@@ -297,7 +311,7 @@ class UserManager():
         """
         return await self.ocs_query(
             method='POST',
-            sub=f'/ocs/v1.php/cloud/users/{user_id}/groups',
+            sub=f'{USERS_STUB}/{user_id}/groups',
             data={'groupid': group_id})
 
     async def remove_user_from_group(self, user_id: str, group_id: str) -> List[str]:
@@ -316,7 +330,7 @@ class UserManager():
         """
         return await self.ocs_query(
             method='DELETE',
-            sub=f'/ocs/v1.php/cloud/users/{user_id}/groups',
+            sub=f'{USERS_STUB}/{user_id}/groups',
             data={'groupid': group_id})
 
     async def promote_user_to_subadmin(self, user_id: str, group_id: str) -> List[str]:
@@ -335,7 +349,7 @@ class UserManager():
         """
         return await self.ocs_query(
             method='POST',
-            sub=f'/ocs/v1.php/cloud/users/{user_id}/subadmins',
+            sub=f'{USERS_STUB}/{user_id}/subadmins',
             data={'groupid': group_id})
 
     async def demote_user_from_subadmin(self, user_id: str, group_id: str) -> List[str]:
@@ -354,7 +368,7 @@ class UserManager():
         """
         return await self.ocs_query(
             method='DELETE',
-            sub=f'/ocs/v1.php/cloud/users/{user_id}/subadmins',
+            sub=f'{USERS_STUB}/{user_id}/subadmins',
             data={'groupid': group_id})
 
     async def get_user_subadmin_groups(self, user_id: str) -> List[str]:
@@ -371,7 +385,7 @@ class UserManager():
         """
         return await self.ocs_query(
             method='GET',
-            sub=f'/ocs/v1.php/cloud/users/{user_id}/subadmins')
+            sub=f'{USERS_STUB}/{user_id}/subadmins')
 
     async def resend_welcome_email(self, user_id: str) -> List[str]:
         """Re-send initial welcome e-mail to `user_id`.
@@ -387,4 +401,4 @@ class UserManager():
         """
         return await self.ocs_query(
             method='POST',
-            sub=f'/ocs/v1.php/cloud/users/{user_id}/welcome')
+            sub=f'{USERS_STUB}/{user_id}/welcome')
@@ -8,10 +8,16 @@ class NextCloudException(Exception):
     reason = None
 
     def __init__(self, status_code: int = None, reason: str = None):
-        """Initialize our very own exception."""
+        """Initialize our very own exception.
+
+        Subclasses carry their status code and reason as class attributes;
+        arguments given here override them for this instance only.
+        """
         super(BaseException, self).__init__()
-        self.status_code = status_code
-        self.reason = reason
+        if status_code is not None:
+            self.status_code = status_code
+        if reason is not None:
+            self.reason = reason
 
     def __str__(self):
         if self.status_code:
@@ -26,10 +32,6 @@ class NextCloudNotModified(NextCloudException):
     status_code = 304
     reason = 'Not modified.'
 
-    def __init__(self):
-        """Configure exception."""
-        super(NextCloudException, self).__init__()
-
 
 class NextCloudBadRequest(NextCloudException):
     """User made an invalid request."""
@@ -37,10 +39,6 @@ class NextCloudBadRequest(NextCloudException):
     status_code = 400
     reason = 'Bad request.'
 
-    def __init__(self):
-        """Configure exception."""
-        super(NextCloudException, self).__init__()
-
 
 class NextCloudUnauthorized(NextCloudException):
     """User account is not authorized."""
@@ -48,10 +46,6 @@ class NextCloudUnauthorized(NextCloudException):
     status_code = 401
     reason = 'Invalid credentials.'
 
-    def __init__(self):
-        """Configure exception."""
-        super(NextCloudException, self).__init__()
-
 
 class NextCloudForbidden(NextCloudException):
     """Forbidden action due to permissions."""
@@ -59,10 +53,6 @@ class NextCloudForbidden(NextCloudException):
     status_code = 403
     reason = 'Forbidden action due to permissions.'
 
-    def __init__(self):
-        """Configure exception."""
-        super(NextCloudException, self).__init__()
-
 
 class NextCloudNotFound(NextCloudException):
     """Object not found."""
@@ -70,10 +60,6 @@ class NextCloudNotFound(NextCloudException):
     status_code = 404
     reason = 'Object not found.'
 
-    def __init__(self):
-        """Configure exception."""
-        super(NextCloudException, self).__init__()
-
 
 class NextCloudRequestTimeout(NextCloudException):
     """HTTP Request timed out."""
@@ -81,10 +67,6 @@ class NextCloudRequestTimeout(NextCloudException):
     status_code = 408
     reason = "Request timed out."
 
-    def __init__(self):
-        """Configure exception."""
-        super(NextCloudException, self).__init__()
-
 
 class NextCloudLoginFlowTimeout(NextCloudException):
     """When the login flow times out."""
@@ -92,9 +74,6 @@ class NextCloudLoginFlowTimeout(NextCloudException):
     status_code = 408
     reason = "Login flow timed out.  Try again."
 
-    def __init__(self):
-        """Configure exception."""
-        super(NextCloudException, self).__init__()
 
 class NextCloudTooManyRequests(NextCloudException):
     """Too many requests"""
@@ -102,16 +81,9 @@ class NextCloudTooManyRequests(NextCloudException):
     status_code = 429
     reason = "Too many requests. Try again later."
 
-    def __init__(self):
-        """Configure exception."""
-        super(NextCloudException, self).__init__()
 
 class NextCloudChunkedUploadException(NextCloudException):
     """When there is more than one chunk in the local cache directory."""
 
     status_code = 999
     reason = "Unable to determine chunked upload state."
-
-    def __init__(self):
-        """Configure exception."""
-        super(NextCloudException, self).__init__()
@@ -1,9 +1,17 @@
+import asyncio
+import warnings
 
 from unittest import TestCase
+from unittest.mock import patch
 
 from nextcloud_async.helpers import (
+    TTLCache,
+    gather_limited,
+    json_dumps,
+    json_loads,
     recursive_urlencode,
-    resolve_element_list)
+    resolve_element_list,
+    single_flight)
 
 
 class TestHelpers(TestCase):
@@ -13,6 +21,100 @@ class TestHelpers(TestCase):
         r = recursive_urlencode(a)
         assert r == 'configData[key1]=val1&configData[key2]=val2'
 
+    def test_json_dumps(self):
+        r = json_dumps({'id': 'geo:1,2', 'name': 'Café', 'size': 3})
+        assert r == '{"id":"geo:1,2","name":"Café","size":3}'
+
+        with patch('nextcloud_async.helpers.orjson', None):
+            assert json_dumps({'id': 'geo:1,2', 'name': 'Café', 'size': 3}) == r
+
+    def test_json_loads(self):
+        content = '{"ocs":{"data":["caf\u00e9"]}}'.encode('utf-8')
+        assert json_loads(content) == {'ocs': {'data': ['café']}}
+
+        with patch('nextcloud_async.helpers.orjson', None):
+            assert json_loads(content) == {'ocs': {'data': ['café']}}
+
+    def test_single_flight(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return {'token': 'abc'}
+
+        async def main():
+            inflight = {}
+            results = await asyncio.gather(
+                *(single_flight(inflight, 'abc', fetch) for _ in range(3)))
+            await asyncio.sleep(0)
+            return inflight, results
+
+        inflight, results = asyncio.run(main())
+        assert len(calls) == 1
+        assert results == [{'token': 'abc'}] * 3
+        assert inflight == {}
+
+    def test_single_flight_dropped_key(self):
+        release = asyncio.Event()
+
+        async def main():
+            inflight = {}
+            first = asyncio.ensure_future(
+                single_flight(inflight, 'abc', lambda: asyncio.sleep(0)))
+            await asyncio.sleep(0)
+            del inflight['abc']
+            second = asyncio.ensure_future(single_flight(inflight, 'abc', release.wait))
+            await first
+            await asyncio.sleep(0)
+            still_running = 'abc' in inflight
+            release.set()
+            await second
+            return still_running
+
+        assert asyncio.run(main())
+
+    def test_gather_limited(self):
+        running = []
+        peak = []
+
+        async def work(n):
+            running.append(n)
+            peak.append(len(running))
+            await asyncio.sleep(0)
+            running.remove(n)
+            return n
+
+        results = asyncio.run(gather_limited(2, *(work(n) for n in range(5))))
+        assert results == list(range(5))
+        assert max(peak) == 2
+
+    def test_gather_limited_invalid_concurrency(self):
+        async def work():
+            return 1
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            for concurrency in (0, -1):
+                with self.assertRaises(ValueError):
+                    asyncio.run(gather_limited(concurrency, work(), work()))
+
+    def test_ttl_cache(self):
+        cache = TTLCache(ttl=10, maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        assert cache.get('a') == 1
+
+        # 'b' is now least recently used and gets evicted
+        cache.set('c', 3)
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert len(cache) == 2
+
+        with patch('nextcloud_async.helpers.time.monotonic', return_value=float('inf')):
+            assert cache.get('a', 'expired') == 'expired'
+        assert len(cache) == 1
+
     def test_resolve_element_list(self):
         KEY = 'apps'
         EMPTY_ANSWER = []
@@ -8,7 +8,8 @@ from .base import BaseTestCase
 from .helpers import AsyncMock
 from .constants import USER, ENDPOINT, PASSWORD
 
-from nextcloud_async.exceptions import NextCloudException
+from nextcloud_async import NextCloudAsync
+from nextcloud_async.exceptions import NextCloudException, NextCloudNotFound
 
 import asyncio
 import httpx
@@ -218,4 +219,38 @@ class OCSGeneralAPI(BaseTestCase):  # noqa: D101
                     data=None,
                     headers={'OCS-APIRequest': 'true'})
                 self.assertRaises(NextCloudException)
-    
\ No newline at end of file
+
+    def test_async_context_manager_leaves_caller_client_open(self):  # noqa: D102
+        async def use_client():
+            async with self.ncc as nca:
+                assert nca is self.ncc
+
+        with patch('httpx.AsyncClient.aclose', new_callable=AsyncMock) as mock:
+            asyncio.run(use_client())
+        mock.assert_not_called()
+
+    def test_async_context_manager_closes_own_client(self):  # noqa: D102
+        async def use_client():
+            async with NextCloudAsync(endpoint=ENDPOINT, user=USER, password=PASSWORD):
+                pass
+
+        with patch('httpx.AsyncClient.aclose', new_callable=AsyncMock) as mock:
+            asyncio.run(use_client())
+        mock.assert_called_once_with()
+
+    def test_endpoint_required(self):  # noqa: D102
+        with patch('httpx.AsyncClient') as client:
+            with self.assertRaises(ValueError):
+                NextCloudAsync(user=USER, password=PASSWORD)
+        client.assert_not_called()
+
+    def test_status_code_exception(self):  # noqa: D102
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock,
+                return_value=httpx.Response(status_code=404)):
+            with self.assertRaises(NextCloudNotFound) as cm:
+                asyncio.run(self.ncc.get_status())
+        assert cm.exception.status_code == 404
+        assert str(cm.exception) == '[404] Object not found.'
+        assert str(NextCloudNotFound(reason='Gone.')) == '[404] Gone.'
@@ -1,5 +1,7 @@
 # noqa: D100
 
+from nextcloud_async.exceptions import NextCloudException, NextCloudNotFound
+from nextcloud_async.api.ocs.shares import SharePermission, ShareType
 from nextcloud_async.helpers import recursive_urlencode
 from .base import BaseTestCase
 from .helpers import AsyncMock
@@ -8,6 +10,8 @@ from .constants import USER, ENDPOINT, PASSWORD
 import asyncio
 import httpx
 
+import datetime as dt
+
 from unittest.mock import patch
 
 
@@ -43,8 +47,8 @@ class OCSShareAPI(BaseTestCase):  # noqa: D101
 
     def test_get_file_shares(self):  # noqa: D102
         PATH = b''
-        RESHARES = 'True'
-        SUBFILES = 'True'
+        RESHARES = True
+        SUBFILES = True
         json_response = bytes(
             '{"ocs":{"meta":{"status":"ok","statuscode":200,"message":"OK"},"'
             'data":[{"id":"1","share_type":0,"uid_owner":"admin","displayname'
@@ -66,8 +70,8 @@ class OCSShareAPI(BaseTestCase):  # noqa: D101
                     content=json_response)) as mock:
             urldata = recursive_urlencode({
                 'path': PATH,
-                'reshares': RESHARES,
-                'subfiles': SUBFILES})
+                'reshares': 'true',
+                'subfiles': 'true'})
             asyncio.run(self.ncc.get_file_shares(PATH, RESHARES, SUBFILES))
             mock.assert_called_with(
                 method='GET',
@@ -108,4 +112,117 @@ class OCSShareAPI(BaseTestCase):  # noqa: D101
                 headers={'OCS-APIRequest': 'true'})
             assert isinstance(response, dict)
 
+    def test_get_shares(self):  # noqa: D102
+        def respond(method, auth, url, data, headers):
+            share_id = url.split('?')[0].rsplit('/', 1)[1]
+            if share_id == '2':
+                return httpx.Response(status_code=404)
+            return httpx.Response(
+                status_code=200,
+                json={'ocs': {'meta': {'status': 'ok'}, 'data': [{'id': share_id}]}})
+
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock,
+                side_effect=respond) as mock:
+            response = asyncio.run(self.ncc.get_shares([3, 2, 1], concurrency=2))
+            assert mock.call_count == 3
+            assert response[0] == {'id': '3'}
+            assert isinstance(response[1], NextCloudNotFound)
+            assert response[2] == {'id': '1'}
+
 # TODO: Finish shares api tests
+
+    def test_update_share(self):  # noqa: D102
+        SHARE_ID = 1
+        NOTE = 'MUTEMATH'
+        json_response = bytes(
+            '{"ocs":{"meta":{"status":"ok","statuscode":200,"message":"OK"},"'
+            'data":{"id":"1","note":"MUTEMATH"}}}', 'utf-8')
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock,
+                return_value=httpx.Response(
+                    status_code=200,
+                    content=json_response)) as mock:
+            response = asyncio.run(self.ncc.update_share(SHARE_ID, note=NOTE))
+            mock.assert_called_once_with(
+                method='PUT',
+                auth=(USER, PASSWORD),
+                url=f'{ENDPOINT}/ocs/v2.php/apps/files_sharing/api/v1/shares/{SHARE_ID}',
+                data={'note': NOTE, 'format': 'json'},
+                headers={'OCS-APIRequest': 'true'})
+            assert response == [{'id': '1', 'note': NOTE}]
+
+    def test_create_share_invalid_expire_date(self):  # noqa: D102
+        today = dt.date.today().isoformat()
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock) as mock:
+            for expire_date in ('2030-02-30', '2030-1-01', '2030-01-01\n', today):
+                with self.assertRaises(NextCloudException):
+                    asyncio.run(self.ncc.create_share(
+                        'file', ShareType.user, SharePermission.read,
+                        expire_date=expire_date))
+            mock.assert_not_called()
+
+    def test_create_share(self):  # noqa: D102
+        PATH = '/Nextcloud Manual.pdf'
+        json_response = bytes(
+            '{"ocs":{"meta":{"status":"ok","statuscode":200,"message":"OK"},"'
+            'data":{"id":"1","share_type":3}}}', 'utf-8')
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock,
+                return_value=httpx.Response(
+                    status_code=200,
+                    content=json_response)) as mock:
+            asyncio.run(self.ncc.create_share(
+                PATH, ShareType.public, SharePermission.read))
+            mock.assert_called_with(
+                method='POST',
+                auth=(USER, PASSWORD),
+                url=f'{ENDPOINT}/ocs/v2.php/apps/files_sharing/api/v1/shares',
+                data={
+                    'path': PATH,
+                    'shareType': 3,
+                    'permissions': 1,
+                    'publicUpload': 'false',
+                    'format': 'json'},
+                headers={'OCS-APIRequest': 'true'})
+
+    def test_create_share_invalid_type_or_permissions(self):  # noqa: D102
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock) as mock:
+            for share_type, permissions in ((2, 1), (ShareType.user, 32)):
+                with self.assertRaises(NextCloudException):
+                    asyncio.run(self.ncc.create_share('file', share_type, permissions))
+            mock.assert_not_called()
+
+    def test_update_share_multiple_fields(self):  # noqa: D102
+        SHARE_ID = 1
+        json_response = bytes(
+            '{"ocs":{"meta":{"status":"ok","statuscode":200,"message":"OK"},"'
+            'data":{"id":"1"}}}', 'utf-8')
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock,
+                return_value=httpx.Response(
+                    status_code=200,
+                    content=json_response)) as mock:
+            asyncio.run(self.ncc.update_share(
+                SHARE_ID,
+                permissions=SharePermission.read,
+                allow_public_upload=False,
+                note=''))
+            mock.assert_called_once_with(
+                method='PUT',
+                auth=(USER, PASSWORD),
+                url=f'{ENDPOINT}/ocs/v2.php/apps/files_sharing/api/v1/shares/{SHARE_ID}',
+                data={
+                    'permissions': 1,
+                    'publicUpload': 'false',
+                    'note': '',
+                    'format': 'json'},
+                headers={'OCS-APIRequest': 'true'})
@@ -1,6 +1,7 @@
 # noqa: D100
 
 from nextcloud_async.api.ocs.status import StatusType as ST
+from nextcloud_async.exceptions import NextCloudException, NextCloudNotFound
 
 from .base import BaseTestCase
 from .helpers import AsyncMock
@@ -108,6 +109,15 @@ class OCSStatusAPI(BaseTestCase):  # noqa: D101
                 data={'format': 'json', 'messageId': MESSAGEID, 'clearAt': CLEAR_AT},
                 headers={'OCS-APIRequest': 'true'})
 
+    def test_invalid_clear_at(self):  # noqa: D102
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock) as mock:
+            for clear_at in ('soon', float('nan'), dt.datetime.now().timestamp() - 60):
+                with self.assertRaises(NextCloudException):
+                    asyncio.run(self.ncc.set_status_message('MUTEMATH', clear_at=clear_at))
+            mock.assert_not_called()
+
     def test_set_status_message(self):  # noqa: D102
         MESSAGE = 'Stinkfist'
         json_response = bytes(
@@ -165,6 +175,26 @@ class OCSStatusAPI(BaseTestCase):  # noqa: D101
                 data=None,
                 headers={'OCS-APIRequest': 'true'})
 
+    def test_get_all_user_statuses_cached(self):  # noqa: D102
+        json_response = bytes(
+            '{"ocs":{"meta":{"status":"ok","statuscode":200,"message":"OK"},'
+            f'"data":[{{"userId":"{USER}","status":"away"}}]}}}}', 'utf-8')
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock,
+                return_value=httpx.Response(
+                    status_code=200,
+                    content=json_response)) as mock:
+            first = asyncio.run(self.ncc.get_all_user_statuses())
+            first[0]['status'] = 'online'
+            second = asyncio.run(self.ncc.get_all_user_statuses())
+            assert second == [{'userId': USER, 'status': 'away'}]
+            assert mock.call_count == 1
+
+            asyncio.run(self.ncc.clear_status_message())
+            asyncio.run(self.ncc.get_all_user_statuses())
+            assert mock.call_count == 3
+
     def test_get_user_status(self):  # noqa: D102
         json_response = bytes(
             '{"ocs":{"meta":{"status":"ok","statuscode":200,"message":"OK"},'
@@ -185,3 +215,99 @@ class OCSStatusAPI(BaseTestCase):  # noqa: D101
                 data=None,
                 headers={'OCS-APIRequest': 'true'})
             assert response['userId'] == USER
+
+    def test_get_user_status_coalesced(self):  # noqa: D102
+        json_response = bytes(
+            '{"ocs":{"meta":{"status":"ok","statuscode":200,"message":"OK"},'
+            f'"data":{{"userId":"{USER}","status":"away"}}}}}}', 'utf-8')
+
+        async def fetch_many():
+            return await asyncio.gather(
+                *(self.ncc.get_user_status(USER) for _ in range(3)))
+
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock,
+                return_value=httpx.Response(
+                    status_code=200,
+                    content=json_response)) as mock:
+            responses = asyncio.run(fetch_many())
+            assert mock.call_count == 1
+            assert all(r['userId'] == USER for r in responses)
+            responses[0]['status'] = 'online'
+            assert responses[1]['status'] == 'away'
+
+    def test_get_user_statuses(self):  # noqa: D102
+        def respond(method, auth, url, data, headers):
+            user = url.split('?')[0].rsplit('/', 1)[1]
+            if user == 'nobody':
+                return httpx.Response(status_code=404)
+            return httpx.Response(
+                status_code=200,
+                json={'ocs': {'meta': {'status': 'ok'}, 'data': {'userId': user}}})
+
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock,
+                side_effect=respond) as mock:
+            response = asyncio.run(
+                self.ncc.get_user_statuses([USER, 'nobody', 'other'], concurrency=2))
+            assert mock.call_count == 3
+            assert response[0] == {'userId': USER}
+            assert isinstance(response[1], NextCloudNotFound)
+            assert response[2] == {'userId': 'other'}
+
+    def test_get_user_status_after_write_not_coalesced(self):  # noqa: D102
+        status = {'userId': USER, 'status': 'online'}
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def ocs_query(method='GET', sub='', data={}, **kwargs):
+            if method == 'PUT':
+                status['status'] = data['statusType']
+                return dict(status)
+            snapshot = dict(status)
+            if snapshot['status'] == 'online':
+                started.set()
+                await release.wait()  # still in flight while the status changes
+            return snapshot
+
+        async def read_after_write():
+            stale = asyncio.ensure_future(self.ncc.get_user_status(USER))
+            await started.wait()
+            await self.ncc.set_status(ST['away'])
+            fresh = await self.ncc.get_user_status(USER)
+            release.set()
+            return await stale, fresh
+
+        with patch.object(self.ncc, 'ocs_query', ocs_query):
+            stale, fresh = asyncio.run(asyncio.wait_for(read_after_write(), 1))
+            assert stale['status'] == 'online'
+            assert fresh['status'] == 'away'
+
+    def test_get_all_user_statuses_not_cached_across_write(self):  # noqa: D102
+        status = {'userId': USER, 'status': 'online'}
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def ocs_query(method='GET', sub='', data={}, **kwargs):
+            if method == 'PUT':
+                status['status'] = data['statusType']
+                return dict(status)
+            snapshot = [dict(status)]
+            if not started.is_set():
+                started.set()
+                await release.wait()  # still in flight while the status changes
+            return snapshot
+
+        async def list_across_write():
+            stale = asyncio.ensure_future(self.ncc.get_all_user_statuses())
+            await started.wait()
+            await self.ncc.set_status(ST['away'])
+            release.set()
+            await stale
+            return await self.ncc.get_all_user_statuses()
+
+        with patch.object(self.ncc, 'ocs_query', ocs_query):
+            statuses = asyncio.run(asyncio.wait_for(list_across_write(), 1))
+            assert statuses == [{'userId': USER, 'status': 'away'}]
@@ -0,0 +1,311 @@
+# noqa: D100
+
+from nextcloud_async.api.ocs.talk.constants import Permissions, permissions_mask
+from nextcloud_async.api.ocs.talk.exceptions import NextCloudTalkBadRequest
+from nextcloud_async.api.ocs.talk.rich_objects import File, GeoLocation, User
+from nextcloud_async.exceptions import NextCloudNotFound
+
+from .base import BaseTestCase
+from .helpers import AsyncMock
+from .constants import USER, ENDPOINT, PASSWORD, EMPTY_200
+
+import asyncio
+import httpx
+
+from unittest.mock import patch
+
+TALK_FEATURES = [
+    'conversation-v4', 'chat-v2', 'chat-read-marker', 'chat-unread', 'room-description']
+CHAT_URL = f'{ENDPOINT}/ocs/v2.php/apps/spreed/api/v1/chat'
+ROOM_URL = f'{ENDPOINT}/ocs/v2.php/apps/spreed/api/v4/room'
+
+
+class NextCloudTalkAPI(BaseTestCase):  # noqa: D101
+
+    def setUp(self):  # noqa: D102
+        super().setUp()
+        capabilities = patch.object(
+            self.ncc,
+            'get_capabilities',
+            new_callable=AsyncMock,
+            return_value=TALK_FEATURES)
+        capabilities.start()
+        self.addCleanup(capabilities.stop)
+
+    def test_mark_conversation_message_read_coalesced(self):  # noqa: D102
+        async def mark_read():
+            return await asyncio.gather(
+                self.ncc.mark_conversation_message_read('t', 5),
+                self.ncc.mark_conversation_message_read('t', 9),
+                self.ncc.mark_conversation_message_read('t', 7))
+
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock,
+                return_value=httpx.Response(
+                    status_code=200,
+                    content=EMPTY_200)) as mock:
+            responses = asyncio.run(mark_read())
+            mock.assert_called_once_with(
+                method='POST',
+                auth=(USER, PASSWORD),
+                url=f'{CHAT_URL}/t/read',
+                data={'lastReadMessage': 9, 'format': 'json'},
+                headers={'OCS-APIRequest': 'true'})
+            assert len(responses) == 3
+
+    def test_mark_read_then_unread_keeps_order(self):  # noqa: D102
+        self.ncc.read_marker_delay = 10
+
+        async def mark():
+            await asyncio.gather(
+                self.ncc.mark_conversation_message_read('t', 100),
+                self.ncc.mark_conversation_message_unread('t', 50))
+
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock,
+                return_value=httpx.Response(
+                    status_code=200,
+                    content=EMPTY_200)) as mock:
+            asyncio.run(asyncio.wait_for(mark(), 1))
+            sent = [(c.kwargs['method'], c.kwargs['data']['lastReadMessage'])
+                    for c in mock.call_args_list]
+            assert sent == [('POST', 100), ('DELETE', 50)]
+
+    def test_iter_conversation_messages(self):  # noqa: D102
+        pages = {
+            None: ([{'id': 3}, {'id': 2}], '2'),
+            '2': ([{'id': 1}], '1')}
+
+        def respond(method, auth, url, data, headers):
+            last_known = dict(
+                p.split('=') for p in url.split('?')[1].split('&')).get('lastKnownMessageId')
+            if last_known not in pages:
+                return httpx.Response(status_code=304)
+            messages, last_given = pages[last_known]
+            return httpx.Response(
+                status_code=200,
+                headers={'X-Chat-Last-Given': last_given},
+                json={'ocs': {'meta': {'status': 'ok'}, 'data': messages}})
+
+        async def collect():
+            return [m['id'] async for m in self.ncc.iter_conversation_messages('t', limit=2)]
+
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock,
+                side_effect=respond) as mock:
+            assert asyncio.run(collect()) == [3, 2, 1]
+            assert mock.call_count == 3
+            assert all('setReadMarker=0' in c.kwargs['url'] for c in mock.call_args_list)
+            assert 'lastKnownMessageId=1' in mock.call_args_list[-1].kwargs['url']
+
+    def test_iter_conversation_messages_cancels_prefetch(self):  # noqa: D102
+        cancelled = []
+
+        async def get_messages(token, limit, last_known_message, set_read_marker):
+            if last_known_message is None:
+                return [{'id': 2}], {'X-Chat-Last-Given': '2'}
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(last_known_message)
+                raise
+
+        async def first_message():
+            messages = self.ncc.iter_conversation_messages('t')
+            async for message in messages:
+                await asyncio.sleep(0)  # let the prefetch of the next page start
+                break
+            await messages.aclose()
+            await asyncio.sleep(0)
+            return message, list(cancelled)
+
+        with patch.object(self.ncc, 'get_conversation_messages', get_messages):
+            assert asyncio.run(first_message()) == ({'id': 2}, [2])
+
+    def test_rich_object_metadata_follows_attributes(self):  # noqa: D102
+        user = User('alice', 'Alice')
+        user.name = 'Bob'
+        user.metadata['name'] = 'Mallory'
+        assert user.metadata == {'id': 'alice', 'name': 'Bob'}
+
+        location = GeoLocation('Home', '1.0', '2.0')
+        location.latitude = '3.0'
+        assert location.metadata['id'] == 'geo:3.0,2.0'
+
+    def test_rich_object_extra_properties(self):  # noqa: D102
+        file = File('notes.md', '/notes.md', size=3, **{'preview-available': 'yes'})
+        assert file.size == 3
+        assert getattr(file, 'preview-available') == 'yes'
+        assert file.metadata == {
+            'id': 'notes.md', 'name': 'notes.md', 'path': '/notes.md',
+            'size': 3, 'preview-available': 'yes'}
+
+        user = User('alice', 'Alice', avatar='a.png')
+        assert user.avatar == 'a.png'
+        with self.assertRaises(AttributeError):
+            user.missing
+
+    def test_configure_conversation(self):  # noqa: D102
+        def respond(method, auth, url, data, headers):
+            if url.endswith('/description'):
+                return httpx.Response(status_code=404)
+            return httpx.Response(status_code=200, content=EMPTY_200)
+
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock,
+                side_effect=respond) as mock:
+            results = asyncio.run(self.ncc.configure_conversation(
+                't',
+                new_name='MUTEMATH',
+                description='Armistice',
+                default_permissions=Permissions.custom | Permissions.can_publish_audio))
+            assert list(results) == ['new_name', 'description', 'default_permissions']
+            assert results['new_name'] == []
+            assert isinstance(results['description'], NextCloudNotFound)
+            mock.assert_any_call(
+                method='PUT',
+                auth=(USER, PASSWORD),
+                url=f'{ROOM_URL}/t/permissions/default',
+                data={'mode': 'default', 'permissions': 17, 'format': 'json'},
+                headers={'OCS-APIRequest': 'true'})
+
+    def test_configure_conversation_invalid_scope(self):  # noqa: D102
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock) as mock:
+            with self.assertRaises(NextCloudTalkBadRequest):
+                asyncio.run(self.ncc.configure_conversation(
+                    't', new_name='MUTEMATH', scope='world'))
+            mock.assert_not_called()
+
+    def test_remove_participants_from_conversation(self):  # noqa: D102
+        def respond(method, auth, url, data, headers):
+            if data['attendeeId'] == 2:
+                return httpx.Response(status_code=404)
+            return httpx.Response(status_code=200, content=EMPTY_200)
+
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock,
+                side_effect=respond) as mock:
+            results = asyncio.run(
+                self.ncc.remove_participants_from_conversation('t', [1, 2, 3], concurrency=2))
+            assert mock.call_count == 3
+            assert results[0] == [] and results[2] == []
+            assert isinstance(results[1], NextCloudNotFound)
+
+    def test_permissions_mask(self):  # noqa: D102
+        assert permissions_mask() == 0
+        mask = permissions_mask(Permissions.start_call, Permissions.join_call, 1)
+        assert mask == 7
+        assert type(mask) is int
+
+    def test_get_conversation_coalesced(self):  # noqa: D102
+        async def fetch_many():
+            return await asyncio.gather(
+                *(self.ncc.get_conversation('t') for _ in range(3)))
+
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock,
+                return_value=httpx.Response(
+                    status_code=200,
+                    json={'ocs': {'meta': {'status': 'ok'}, 'data': {'token': 't'}}})) as mock:
+            rooms = asyncio.run(fetch_many())
+            assert mock.call_count == 1
+            assert rooms == [{'token': 't'}] * 3
+            rooms[0]['token'] = 'changed'
+            assert rooms[1]['token'] == 't'
+
+    def test_autocomplete_suggestions_cached_copies(self):  # noqa: D102
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock,
+                return_value=httpx.Response(
+                    status_code=200,
+                    json={'ocs': {'meta': {'status': 'ok'}, 'data': [{'id': USER}]}})) as mock:
+            first = asyncio.run(
+                self.ncc.get_conversation_autocomplete_suggestions('t', 'us'))
+            first[0]['id'] = 'changed'
+            second = asyncio.run(
+                self.ncc.get_conversation_autocomplete_suggestions('t', 'us'))
+            assert mock.call_count == 1
+            assert second == [{'id': USER}]
+
+    def test_get_conversation_after_write_not_coalesced(self):  # noqa: D102
+        room = {'name': 'old'}
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def ocs_query(method='GET', sub='', data={}, **kwargs):
+            if method == 'PUT':
+                room['name'] = data['roomName']
+                return []
+            snapshot = dict(room)
+            if snapshot['name'] == 'old':
+                started.set()
+                await release.wait()  # still in flight while the rename runs
+            return snapshot
+
+        async def read_after_write():
+            stale = asyncio.ensure_future(self.ncc.get_conversation('t'))
+            await started.wait()
+            await self.ncc.rename_conversation('t', 'new')
+            fresh = await self.ncc.get_conversation('t')
+            release.set()
+            return await stale, fresh
+
+        with patch.object(self.ncc, 'ocs_query', ocs_query):
+            stale, fresh = asyncio.run(asyncio.wait_for(read_after_write(), 1))
+            assert stale == {'name': 'old'}
+            assert fresh == {'name': 'new'}
+
+    def test_mark_conversations_read(self):  # noqa: D102
+        def respond(method, auth, url, data, headers):
+            if url == f'{CHAT_URL}/b/read':
+                return httpx.Response(status_code=404)
+            return httpx.Response(status_code=200, content=EMPTY_200)
+
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock,
+                side_effect=respond) as mock:
+            results = asyncio.run(
+                self.ncc.mark_conversations_read({'a': 5, 'b': 7, 'c': 9}, concurrency=2))
+            sent = sorted(
+                (c.kwargs['method'], c.kwargs['url'], c.kwargs['data']['lastReadMessage'])
+                for c in mock.call_args_list)
+            assert sent == [
+                ('POST', f'{CHAT_URL}/a/read', 5),
+                ('POST', f'{CHAT_URL}/b/read', 7),
+                ('POST', f'{CHAT_URL}/c/read', 9)]
+            assert len(results) == 3
+            assert isinstance(results[1], NextCloudNotFound)
+            assert not isinstance(results[0], Exception)
+            assert not isinstance(results[2], Exception)
+
+    def test_get_conversations_by_token(self):  # noqa: D102
+        def respond(method, auth, url, data, headers):
+            token = url.split('?')[0].rsplit('/', 1)[1]
+            if token == 'missing':
+                return httpx.Response(status_code=404)
+            return httpx.Response(
+                status_code=200,
+                json={'ocs': {'meta': {'status': 'ok'}, 'data': {'token': token}}})
+
+        with patch(
+                'httpx.AsyncClient.request',
+                new_callable=AsyncMock,
+                side_effect=respond) as mock:
+            rooms = asyncio.run(
+                self.ncc.get_conversations_by_token(['b', 'missing', 'a', 'b']))
+            assert mock.call_count == 3
+            assert rooms[0] == {'token': 'b'}
+            assert isinstance(rooms[1], NextCloudNotFound)
+            assert rooms[2] == {'token': 'a'}
+            assert rooms[3] == {'token': 'b'}
+            assert rooms[3] is not rooms[0]